@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from .base_background_scene import BaseBackgroundScene
-from .config import BackgroundStyle
+from .config import BACKGROUND_STYLE_VALUES, BackgroundStyle
 
 __all__ = [
     "BaseBackgroundScene",
     "BackgroundStyle",
+    "BACKGROUND_STYLE_VALUES",
 ]
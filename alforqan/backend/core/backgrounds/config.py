@@ -25,6 +25,10 @@ class BackgroundStyle(Enum):
     HEXAGONAL = "hexagonal"
 
 
+# Member values in declaration order, built once for option lists
+BACKGROUND_STYLE_VALUES: tuple[str, ...] = tuple(style.value for style in BackgroundStyle)
+
+
 @dataclass
 class PatternConfig:
     """Configuration class for pattern generation with smart defaults."""
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-__all__ = ["ColorScheme", "COLOR_SCHEMES"]
+__all__ = ["ColorScheme", "COLOR_SCHEMES", "COLOR_SCHEME_VALUES"]
 
 
 class ColorScheme(Enum):
@@ -29,6 +29,10 @@ class ColorScheme(Enum):
     ISLAMIC_MANUSCRIPT = "islamic_manuscript"
 
 
+# Member values in declaration order, built once for option lists
+COLOR_SCHEME_VALUES: tuple[str, ...] = tuple(scheme.value for scheme in ColorScheme)
+
+
 # The last color used for font and the rest used in background
 COLOR_SCHEMES = {
     ColorScheme.DESERT_SUNSET: ["#B76E22", "#C69749", "#E3C770", "#EAD7BB", "#FFFFFF"],
@@ -9,7 +9,7 @@ License: MIT
 
 from __future__ import annotations
 
-from collections.abc import Generator, Iterator
+from collections.abc import Iterator
 import os
 from pathlib import Path
 import tempfile
@@ -162,15 +162,10 @@ class AudioProcessor:
         :raises ValueError: If no input files provided
         :returns: Dictionary containing output path, duration, formatted duration, and list of duration changes
         """
-        if isinstance(file_paths, Iterator | Generator):
-            file_paths = list(file_paths)
-
-        if not isinstance(file_paths, list):
+        # Iterators are consumed lazily, so merging can begin while later input files are still being produced
+        if not isinstance(file_paths, list | Iterator):
             raise TypeError("file_paths must be a list or iterator of paths")
 
-        if not file_paths:
-            raise ValueError("No input files provided")
-
         merged = AudioSegment.empty()
         duration_changes = []
         total_duration_ms = 0
@@ -204,6 +199,9 @@ class AudioProcessor:
             # Perform the actual merge
             merged = merged.append(current_audio, crossfade=crossfade) if len(merged) > 0 else current_audio
 
+        if not duration_changes:
+            raise ValueError("No input files provided")
+
         merged.export(str(output_path), format="mp3")
         final_duration = self.duration_handler.get_duration(output_path)
 
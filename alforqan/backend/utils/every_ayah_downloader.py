@@ -17,9 +17,11 @@ Datasets/Sources:
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 import json
 from pathlib import Path
+import threading
 import time
 from urllib.parse import urljoin
 
@@ -106,6 +108,8 @@ class QuranAudioDownloader:
 
     BASE_URL = "https://www.everyayah.com/data/"
     RECITATIONS_URL = "https://www.everyayah.com/data/recitations.js"
+    MAX_CONCURRENT_DOWNLOADS = 16  # Stay under everyayah.com's informal per-host connection cap
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
     def __init__(self):
         self.session = self._create_session()
@@ -113,13 +117,25 @@ class QuranAudioDownloader:
         self._reciters: RecitersCollection | None = None
         self._last_request_timestamp = 0.0
         self.request_interval = 1.0  # Minimum seconds between requests
+        self._worker_state = threading.local()  # Holds one reusable read buffer per download thread
 
     @staticmethod
     def _create_session() -> requests.Session:
         """Create and configure an HTTP session with retry logic."""
         session = requests.Session()
-        retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        retry_strategy = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.3,  # Spread out retries from concurrent workers
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,  # Sleep for the interval the server asks for on 429/503
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=QuranAudioDownloader.MAX_CONCURRENT_DOWNLOADS,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -207,17 +223,87 @@ class QuranAudioDownloader:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        file_name = f"{surah_num:03d}{ayah_num:03d}.mp3"
-        file_path = output_path / file_name
-
-        download_url = urljoin(self.BASE_URL, f"{reciter_config.subfolder}/{file_name}")
+        download_url, file_path = self._ayah_target(reciter_config, surah_num, ayah_num, output_path)
         log.info("downloading_ayah", url=download_url)
 
         self._apply_rate_limit()
-        response = self.session.get(download_url)
-        response.raise_for_status()
+        return self._fetch_to_file(download_url, file_path)
+
+    def download_surah(self, reciter_id: int, surah_num: int, output_dir: str | Path, max_workers: int | None = None) -> list[Path]:
+        """Download every ayah of a surah concurrently over the shared session.
+
+        Requests are pipelined through a bounded thread pool so the round-trip latency of each ayah
+        overlaps with the others, instead of paying it serially per file. This deliberately bypasses the
+        per-request ``request_interval`` throttle of ``download_ayah``; the pool size bounds the load instead.
+        Ayahs whose file already exists in ``output_dir`` are not downloaded again.
+
+        :param reciter_id: The ID of the reciter
+        :param surah_num: The surah number
+        :param output_dir: Directory to save the audio files
+        :param max_workers: Maximum concurrent downloads (defaults to ``MAX_CONCURRENT_DOWNLOADS``)
+        :returns: Paths of all the surah's ayah files, downloaded or already present, ordered by ayah number
+        :raises ValueError: If any input parameters are invalid
+        :raises requests.RequestException: If any download fails
+        """
+        log = logger.bind(reciter_id=reciter_id, surah_num=surah_num)
 
-        file_path.write_bytes(response.content)
+        self._validate_surah_ayah(surah_num, 1)
+        reciter_config = self.get_reciter_config(reciter_id)
+        ayah_count = self._load_recitations_data()["ayahCount"][surah_num - 1]
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        targets = [self._ayah_target(reciter_config, surah_num, ayah_num, output_path) for ayah_num in range(1, ayah_count + 1)]
+        missing_targets = [(url, file_path) for url, file_path in targets if not file_path.exists()]
+        log.info("downloading_surah", ayah_count=ayah_count, missing_count=len(missing_targets))
+
+        workers = min(max_workers or self.MAX_CONCURRENT_DOWNLOADS, self.MAX_CONCURRENT_DOWNLOADS)
+        errors: list[BaseException] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._fetch_to_file, url, file_path) for url, file_path in missing_targets]
+            for future in as_completed(futures):
+                if error := future.exception():
+                    errors.append(error)
+
+        if errors:
+            log.error("surah_download_failed", failed_count=len(errors), ayah_count=ayah_count)
+            raise errors[0]
+
+        return [file_path for _, file_path in targets]
+
+    def _ayah_target(self, reciter_config: ReciterConfig, surah_num: int, ayah_num: int, output_path: Path) -> tuple[str, Path]:
+        """Build the download URL and local file path for an ayah."""
+        file_name = f"{surah_num:03d}{ayah_num:03d}.mp3"
+        return urljoin(self.BASE_URL, f"{reciter_config.subfolder}/{file_name}"), output_path / file_name
+
+    def _fetch_to_file(self, url: str, file_path: Path) -> Path:
+        """Stream a URL over the shared session into a file without buffering the whole body."""
+        buffer = getattr(self._worker_state, "buffer", None)
+        if buffer is None:
+            buffer = self._worker_state.buffer = bytearray(self.DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+
+        # Write to a partial file first so an interrupted download is never mistaken for a cached ayah
+        partial_path = file_path.with_name(f"{file_path.name}.part")
+        try:
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                # The response already arrives in chunks, so skip Python's write buffer
+                with open(partial_path, "wb", buffering=0) as file:
+                    while read_size := response.raw.readinto(buffer):
+                        # Unbuffered writes may be partial, so keep writing until the whole chunk is on disk
+                        written = 0
+                        while written < read_size:
+                            written += file.write(view[written:read_size])
+
+            partial_path.replace(file_path)
+        except BaseException:
+            # Do not leave a stale partial file behind for every failed attempt
+            partial_path.unlink(missing_ok=True)
+            raise
         return file_path
 
 
@@ -85,25 +85,16 @@ class FontHelper:
 
     def _initialize_metadata(self) -> None:
         """Initialize font metadata for quick access to common properties."""
+        # fontTools picks the preferred platform/encoding record (Windows English first, then Mac Roman)
         name_table = self.font["name"]
         self.metadata = FontMetadata(
-            family_name=self._get_name_record(1) or "Unknown",
-            style_name=self._get_name_record(2),
-            version=self._get_name_record(5),
+            family_name=name_table.getBestFamilyName() or "Unknown",
+            style_name=name_table.getBestSubFamilyName(),
+            version=name_table.getDebugName(5),
             unicode_range_count=len(self.supported_unicode),
         )
         logger.debug("Font metadata initialized", metadata=self.metadata)
 
-    def _get_name_record(self, name_id: int) -> str | None:
-        """Get a name record from the font's name table."""
-        for record in self.font["name"].names:
-            if record.nameID == name_id:
-                try:
-                    return record.toUnicode()
-                except UnicodeDecodeError:
-                    logger.warning("Failed to decode name record", name_id=name_id, platform_id=record.platformID)
-        return None
-
     def _set_supported_unicode_ranges(self) -> None:
         """Set the supported Unicode ranges for the loaded font."""
         logger.debug("Building Unicode range support map")
@@ -16,28 +16,160 @@ License:
 
 Requirements:
     - structlog
+    - orjson (optional, faster JSON rendering)
 """
 
 from __future__ import annotations
 
+import atexit
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
 import functools
+import json
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+import queue
+import re
+import reprlib
 import sys
 import threading
-import traceback
 from typing import Any, TypeVar, cast
 
 import structlog
-from structlog.typing import Processor
+from structlog.typing import BindableLogger, FilteringBoundLogger, Processor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Type variables for generic type hints
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Size of the in-memory buffer used to batch log file writes
+LOG_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Logging configuration is process-wide, so it is guarded once per process rather than per LogConfig
+_configured = False
+_init_lock = threading.Lock()
+
+# Background listener that owns the real handlers
+_queue_listener: QueueListener | None = None
+
+
+def _serialize_json(obj: Any, **kwargs: Any) -> str:
+    """Serialize an event dict to a JSON string, using orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(obj, **kwargs)
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _serialize_json_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """Serialize an event dict straight to JSON bytes for loggers that write binary files."""
+    if orjson is None:
+        return json.dumps(obj, **kwargs).encode()
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS)
+
+
+def _record_timestamper(fmt: str | None, key: str) -> Processor:
+    """Create a processor that stamps foreign records with their creation time, matching ``TimeStamper(fmt, utc=True, key)``.
+
+    Foreign records are formatted on the listener thread, so stamping them with the current time would
+    reorder them against records that were logged after them.
+    """
+
+    def stamp_record_time(logger: Any, method_name: str, event_dict: dict) -> dict:  # noqa: ARG001
+        created = event_dict["_record"].created
+        event_dict[key] = created if fmt is None else datetime.fromtimestamp(created, tz=UTC).strftime(fmt)
+        return event_dict
+
+    return stamp_record_time
+
+
+class _StructlogQueueHandler(QueueHandler):
+    """Queue handler that enqueues records untouched so ProcessorFormatter still sees structlog's event dict."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Skip the default pre-formatting; the listener thread formats records in-process."""
+        return record
+
+
+class _BufferedFileHandlerMixin(logging.FileHandler):
+    """File handler mixin that accumulates records in a large buffer instead of flushing after each one."""
+
+    def _open(self) -> Any:
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=LOG_WRITE_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+
+    def flush(self) -> None:
+        """Defer flushing to the listener; closing or rotating the stream still writes out pending records."""
+
+    def flush_buffer(self) -> None:
+        """Write all buffered records to the log file."""
+        super().flush()
+
+
+class _BufferedTimedRotatingFileHandler(_BufferedFileHandlerMixin, TimedRotatingFileHandler):
+    """Time-based rotating file handler with batched writes."""
+
+
+class _BufferedRotatingFileHandler(_BufferedFileHandlerMixin, RotatingFileHandler):
+    """Size-based rotating file handler with batched writes."""
+
+    _stream_bytes = 0
+
+    def _open(self) -> Any:
+        """Open the log file and start counting from its current size."""
+        stream = super()._open()
+        self._stream_bytes = stream.tell()
+        return stream
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record and count the bytes it will add to the file, pending buffer included."""
+        message = super().format(record)
+        self._stream_bytes += len(message.encode(self.encoding or "utf-8", self.errors or "strict")) + len(self.terminator)
+        return message
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:  # noqa: N802, ARG002
+        """Rotate once the file has grown past ``maxBytes``, so a file overshoots it by at most one record.
+
+        Unlike the stdlib check this neither formats the record a second time nor seeks the text stream,
+        which would force a flush of the write buffer on every record.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        return int(self.maxBytes > 0 and self._stream_bytes >= self.maxBytes)
+
+
+class _BatchingQueueListener(QueueListener):
+    """Queue listener that flushes buffered handlers once the queue has been drained."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle a record, writing buffered output out in one batch when no more records are waiting."""
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, _BufferedFileHandlerMixin):
+                    handler.flush_buffer()
+
+
+def _stop_queue_listener() -> None:
+    """Drain the log queue and close the handlers of the active listener."""
+    global _queue_listener  # noqa: PLW0603
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 class LogLevel(str, Enum):
     """Valid logging levels."""
@@ -60,9 +192,13 @@ class LogConfig:
     :param filters: List of strings to filter log messages
     :param log_filename: Name of the log file
     :param rotation_interval: When to rotate logs ('midnight', 'h', 'd', etc.)
+    :param max_bytes: Rotate logs by size once the file reaches this many bytes instead of by time
     :param backup_count: Number of backup files to keep
     :param environment: Environment name ('development' or 'production')
     :param console_output: Whether to output logs to console
+    :param capture_stdlib: Route structlog events through the stdlib logging handlers. When False, events are
+        written directly to the log file (without rotation), and the stdlib handlers only serve third-party loggers,
+        writing to a separate ``<name>.stdlib<ext>`` file
 
     Example:
             >>> log_config = LogConfig(
@@ -80,14 +216,11 @@ class LogConfig:
     filters: str | list[str] | None = None
     log_filename: str = "app.log"
     rotation_interval: str = "midnight"
+    max_bytes: int | None = None
     backup_count: int = 30
     environment: str = "production"
     console_output: bool | None = None
-
-    # Internal state
-    _configured: bool = field(default=False, init=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
-    _loggers: dict[str, structlog.stdlib.BoundLogger] = field(default_factory=dict, init=False)
+    capture_stdlib: bool = True
 
     def __post_init__(self) -> None:
         """Initialize derived attributes after instance creation."""
@@ -96,11 +229,25 @@ class LogConfig:
         self.environment = self.environment.lower()
         self.console_output = self.console_output if self.console_output is not None else (self.environment == "development")
         self.log_file_base = self.log_path / self.log_filename
+        self._default_logger_name = self.logger_source or __name__
 
         # Convert single filter to list
         if isinstance(self.filters, str):
             self.filters = [self.filters]
 
+        # Filters are fixed after construction, so match them all with one case-insensitive scan per record
+        self._filter_regex = re.compile("|".join(re.escape(f) for f in self.filters), re.IGNORECASE) if self.filters else None
+        # Production JSON gets a float UTC epoch, which is cheaper to produce and smaller than an ISO string
+        timestamp_fmt, timestamp_key = (None, "ts") if self.environment == "production" else ("%H:%M:%S", "timestamp")
+        self._timestamper = structlog.processors.TimeStamper(fmt=timestamp_fmt, utc=True, key=timestamp_key)
+        # Built once as an immutable chain shared by both handlers and structlog itself
+        self._shared_processors = tuple(self._build_shared_processors())
+        # Third-party records are stamped from LogRecord.created, since they are only processed on the listener thread
+        record_timestamper = _record_timestamper(timestamp_fmt, timestamp_key)
+        self._foreign_pre_chain = tuple(
+            record_timestamper if processor is self._timestamper else processor for processor in self._shared_processors
+        )
+
         # Initialize logging immediately
         self.configure_logging()
 
@@ -112,11 +259,11 @@ class LogConfig:
         except KeyError:
             raise ValueError(f"Invalid log level: {level}. Allowed values are: {', '.join(LogLevel.__members__)}")
 
-    def _get_shared_processors(self) -> list[Processor]:
-        """Get the list of shared log processors."""
+    def _build_shared_processors(self) -> list[Processor]:
+        """Build the list of shared log processors."""
         processors: list[Processor] = [
             structlog.contextvars.merge_contextvars,
-            structlog.processors.TimeStamper(fmt="iso" if self.environment == "production" else "%H:%M:%S"),
+            self._timestamper,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.processors.StackInfoRenderer(),
@@ -125,42 +272,64 @@ class LogConfig:
         ]
 
         # Add custom filter if specified
-        if self.filters:
+        if self._filter_regex is not None:
             processors.append(self._create_filter())
 
-        # Important: Add level filter after other processors
-        # Commented out because it's cause conflect with other library used other logging system
-        # processors.append(structlog.stdlib.filter_by_level)
+        # Level filtering happens in the bound logger (see configure_logging) rather than with
+        # structlog.stdlib.filter_by_level here, which conflicted with libraries using other logging systems
         return processors
 
-    def _create_file_handler(self) -> TimedRotatingFileHandler:
-        """Create a rotating file handler for logging."""
-        handler = TimedRotatingFileHandler(
-            filename=str(self.log_file_base),
-            when=self.rotation_interval,
-            backupCount=self.backup_count,
-            encoding="utf-8",
-            delay=False,
-            utc=True,
-        )
+    def _create_file_handler(self) -> logging.FileHandler:
+        """Create a rotating file handler for logging.
+
+        The file is only opened on the first write, so idle processes never touch the log file.
+        """
+        # In direct mode the main log file belongs to structlog, so foreign loggers get their own file
+        log_file = self.log_file_base if self.capture_stdlib else self.log_file_base.with_suffix(f".stdlib{self.log_file_base.suffix}")
+        handler: logging.FileHandler
+        if self.max_bytes:
+            handler = _BufferedRotatingFileHandler(
+                filename=str(log_file),
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+                delay=True,
+            )
+        else:
+            handler = _BufferedTimedRotatingFileHandler(
+                filename=str(log_file),
+                when=self.rotation_interval,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+                delay=True,
+                utc=True,
+            )
         handler.setLevel(self.log_level)
         return handler
 
     def _create_filter(self) -> Processor:
         """Create a custom log filter processor."""
+        filter_regex = cast(re.Pattern[str], self._filter_regex)
 
         def custom_filter(logger: Any, method_name: str, event_dict: dict) -> dict:
-            message = str(event_dict.get("event", "")).lower()
-            if not self.filters or not any(f.lower() in message for f in cast(list[str], self.filters)):
-                return event_dict
-            raise structlog.DropEvent
+            if filter_regex.search(str(event_dict.get("event", ""))):
+                raise structlog.DropEvent
+            return event_dict
 
         return custom_filter
 
     def configure_logging(self) -> None:
-        """Configure the logging system with the specified settings."""
-        with self._lock:
-            if self._configured:
+        """Configure the logging system with the specified settings.
+
+        Producers only enqueue records; a single background listener thread formats them and performs the I/O.
+        Configuration applies to the whole process, so only the first call takes effect.
+        """
+        global _configured, _queue_listener  # noqa: PLW0603
+        if _configured:
+            return
+
+        with _init_lock:
+            if _configured:
                 return
 
             # Ensure log directory exists
@@ -175,7 +344,7 @@ class LogConfig:
             root_logger.handlers = []
 
             # Get shared processors
-            shared_processors = self._get_shared_processors()
+            shared_processors = self._shared_processors
 
             # Create and configure handlers
             handlers = []
@@ -184,8 +353,8 @@ class LogConfig:
             file_handler = self._create_file_handler()
             file_handler.setFormatter(
                 structlog.stdlib.ProcessorFormatter(
-                    processor=structlog.processors.JSONRenderer(),
-                    foreign_pre_chain=shared_processors,
+                    processor=structlog.processors.JSONRenderer(serializer=_serialize_json),
+                    foreign_pre_chain=self._foreign_pre_chain,
                 )
             )
             handlers.append(file_handler)
@@ -198,56 +367,82 @@ class LogConfig:
                     structlog.stdlib.ProcessorFormatter(
                         processor=structlog.dev.ConsoleRenderer(colors=True)
                         if self.environment == "development"
-                        else structlog.processors.JSONRenderer(),
-                        foreign_pre_chain=shared_processors,
+                        else structlog.processors.JSONRenderer(serializer=_serialize_json),
+                        foreign_pre_chain=self._foreign_pre_chain,
                     )
                 )
                 handlers.append(console_handler)
 
-            # Add all handlers to root logger
-            for handler in handlers:
-                root_logger.addHandler(handler)
+            # Hand records to the listener thread instead of writing on the calling thread
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            root_logger.addHandler(_StructlogQueueHandler(log_queue))
+            _queue_listener = _BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+            _queue_listener.start()
 
-            # Configure structlog
-            structlog.configure(
-                processors=[
-                    *shared_processors,
-                    structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-                ],
-                context_class=dict,
-                logger_factory=structlog.stdlib.LoggerFactory(),
-                wrapper_class=structlog.stdlib.BoundLogger,
-                cache_logger_on_first_use=True,
-            )
+            # Calls below the configured level return immediately, before any processor runs
+            wrapper_class = structlog.make_filtering_bound_logger(logging.getLevelName(self.log_level))
 
-            self._configured = True
+            # Configure structlog
+            if self.capture_stdlib:
+                structlog.configure(
+                    processors=(
+                        *shared_processors,
+                        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+                    ),
+                    context_class=dict,
+                    logger_factory=structlog.stdlib.LoggerFactory(),
+                    wrapper_class=wrapper_class,
+                    cache_logger_on_first_use=True,
+                )
+            else:
+                self._configure_direct_output(shared_processors, wrapper_class)
+
+            _configured = True
+
+    def _configure_direct_output(self, shared_processors: tuple[Processor, ...], wrapper_class: type[BindableLogger]) -> None:
+        """Configure structlog to write rendered JSON bytes straight to the log file, bypassing stdlib logging."""
+        # BytesLogger flushes after every event, so a large write buffer would never fill
+        log_file = open(self.log_file_base, "ab")
+        atexit.register(log_file.close)
+
+        structlog.configure(
+            processors=[
+                # There is no stdlib logger to read the name from; get_logger binds it instead
+                *(processor for processor in shared_processors if processor is not structlog.stdlib.add_logger_name),
+                structlog.processors.JSONRenderer(serializer=_serialize_json_bytes),
+            ],
+            context_class=dict,
+            logger_factory=structlog.BytesLoggerFactory(file=log_file),
+            wrapper_class=wrapper_class,
+            cache_logger_on_first_use=True,
+        )
 
-    def get_logger(self, name: str | None = None) -> structlog.stdlib.BoundLogger:
+    def get_logger(self, name: str | None = None) -> FilteringBoundLogger:
         """Get a configured logger instance."""
-        with self._lock:
-            logger_name = name or self.logger_source or __name__
-
-            if logger_name not in self._loggers:
-                # Ensure logging is configured
-                if not self._configured:
-                    self.configure_logging()
-
-                # Create and cache the logger
-                logger = structlog.get_logger(logger_name)
-                self._loggers[logger_name] = logger
+        # Lock-free: structlog caches the bound logger on first use
+        self.configure_logging()
 
-            return self._loggers[logger_name]
+        logger_name = name or self._default_logger_name
+        logger = structlog.get_logger(logger_name)
+        if not self.capture_stdlib:
+            logger = logger.bind(logger=logger_name)
+        return logger
 
     def log_errors(
         self,
         exclude: tuple[type[Exception], ...] | None = None,
         level: str = "ERROR",
+        capture_args: bool = False,
+        max_repr: int = 256,
     ) -> Callable[[T], T]:
         """
         Create an error logging decorator for the given function.
 
         :param exclude: Tuple of exception types to ignore
         :param level: Logging level to use for errors
+        :param capture_args: Whether to log truncated reprs of the call arguments; otherwise only the
+            positional argument count and keyword names are logged
+        :param max_repr: Maximum length of each argument repr when ``capture_args`` is enabled
         :return: Configured error logging decorator
 
         Example:
@@ -256,6 +451,10 @@ class LogConfig:
             ...     raise ValueError("Something went wrong")
         """
         logger = self.get_logger()
+        log_method = getattr(logger, level.lower())
+
+        arg_repr = reprlib.Repr()
+        arg_repr.maxstring = arg_repr.maxother = max_repr
 
         def decorator(func: T) -> T:
             @functools.wraps(func)
@@ -266,21 +465,22 @@ class LogConfig:
                     if exclude and isinstance(e, exclude):
                         raise
 
-                    # Get the full stack trace
-                    exc_info = sys.exc_info()
-                    stack_trace = "".join(traceback.format_exception(*exc_info)) if exc_info[0] is not None else ""
+                    # Arguments may be huge objects (scenes, data managers), so only repr them on request
+                    if capture_args:
+                        args_field: Any = tuple(arg_repr.repr(arg) for arg in args)
+                        kwargs_field: Any = {key: arg_repr.repr(value) for key, value in kwargs.items()}
+                    else:
+                        args_field, kwargs_field = len(args), tuple(kwargs)
 
-                    # Log the error using structured logging
-                    log_method = getattr(logger, level.lower())
+                    # Log the error using structured logging; format_exc_info renders the traceback
                     log_method(
                         "exception_occurred",
                         function=func.__qualname__,
                         module=func.__module__,
-                        args=repr(args),
-                        kwargs=repr(kwargs),
+                        args=args_field,
+                        kwargs=kwargs_field,
                         exception_type=e.__class__.__name__,
                         exception_message=str(e),
-                        stack_trace=stack_trace,
                         exc_info=True,
                     )
                     raise
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import functools
+import re
 
+# Patterns used by sanitize_name, compiled once at import
+_PARENTHESES_PATTERN = re.compile(r"\s*\([^)]*\)")
+_SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s-]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=256)
 def sanitize_name(name: str) -> str:
     """Sanitize the reciter name by removing parentheses and special characters"""
-    # Remove everything in parentheses and special characters
-    import re
-
     # Remove parentheses and their contents
-    name = re.sub(r"\s*\([^)]*\)", "", name)
+    name = _PARENTHESES_PATTERN.sub("", name)
     # Replace special characters with underscore
-    name = re.sub(r"[^\w\s-]", "_", name)
+    name = _SPECIAL_CHARS_PATTERN.sub("_", name)
     # Replace multiple spaces with single underscore
-    name = re.sub(r"\s+", "_", name)
+    name = _WHITESPACE_PATTERN.sub("_", name)
     # Remove leading/trailing underscores
     return name.strip("_").lower()
@@ -15,48 +15,66 @@ License: MIT
 
 Requirements:
     - pydantic
-    - toml
+    - toml (saving TOML files; loading uses the standard library tomllib)
     - pyyaml
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
+import tomllib
 from typing import Any
 
 from pydantic import BaseModel, ValidationError
 import toml
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class Config:
     def __init__(self, config_path: str | Path):
         self.config_path = Path(config_path)
         self.config_data: dict[str, Any] = {}
+        self._flat: dict[str, Any] = {}
+        self._leaf_keys: list[str] = []
         self.load_config()
 
     def load_config(self) -> None:
         """Load the configuration file based on its extension."""
         if self.config_path.suffix == ".toml":
-            self.config_data = toml.load(self.config_path)
+            with open(self.config_path, "rb") as file:
+                self.config_data = tomllib.load(file)
         elif self.config_path.suffix in (".yaml", ".yml"):
-            with open(self.config_path) as file:
-                self.config_data = yaml.safe_load(file)
+            # Use the libyaml-backed loader when PyYAML was built with it
+            with open(self.config_path, "rb") as file:
+                self.config_data = yaml.load(file, Loader=SafeLoader)
         else:
             raise ValueError(f"Unsupported file format: {self.config_path.suffix}")
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Build the flat dot-key index used for constant-time lookups."""
+        self._flat = dict(self._iter_flat(self.config_data, ""))
+        self._leaf_keys = [key for key, value in self._flat.items() if not isinstance(value, dict)]
+
+    @classmethod
+    def _iter_flat(cls, data: dict[str, Any], prefix: str) -> Iterator[tuple[str, Any]]:
+        """Yield (dot_key, value) pairs for every table and value in the configuration."""
+        for key, value in data.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+            yield full_key, value
+            if isinstance(value, dict):
+                yield from cls._iter_flat(value, full_key)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the configuration using dot notation."""
-        keys = key.split(".")
-        value = self.config_data
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def validate_schema(self, schema: BaseModel) -> None:
         """Validate the configuration against a Pydantic schema."""
@@ -80,6 +98,7 @@ class Config:
         for k in keys[:-1]:
             data = data.setdefault(k, {})
         data[keys[-1]] = value
+        self._build_index()
 
     def save(self) -> None:
         """Save the current configuration back to the file."""
@@ -105,15 +124,7 @@ class Config:
 
     def get_nested(self, keys: list[str], default: Any = None) -> Any:
         """Get a nested value from the configuration."""
-        value = self.config_data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
-        return value
+        return self.get(".".join(keys), default)
 
     def has_key(self, key: str) -> bool:
         """Check if a key exists in the configuration."""
@@ -121,16 +132,4 @@ class Config:
 
     def get_keys(self, prefix: str = "") -> list[str]:
         """Get all keys in the configuration, optionally filtered by prefix."""
-
-        def traverse(data: dict[str, Any], current_prefix: str) -> list[str]:
-            keys = []
-            for key, value in data.items():
-                full_key = f"{current_prefix}.{key}" if current_prefix else key
-                if isinstance(value, dict):
-                    keys.extend(traverse(value, full_key))
-                else:
-                    keys.append(full_key)
-            return keys
-
-        all_keys = traverse(self.config_data, "")
-        return [key for key in all_keys if key.startswith(prefix)]
+        return [key for key in self._leaf_keys if key.startswith(prefix)]
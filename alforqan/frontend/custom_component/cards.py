@@ -5,8 +5,33 @@
 
 from __future__ import annotations
 
+from alforqan.frontend.custom_component.grid import create_html_grid
+
 import streamlit as st
 
+_CARD_TEMPLATE = """
+<div class="card card--{variant} {animation_class}" {styles}>
+    <div class="icon">{icon}</div>
+    <div class="content">
+        <h3>{title}</h3>
+        <p>{description}</p>
+    </div>
+</div>
+"""
+
+
+def _render_card(icon: str, title: str, description: str, *, animate: bool, custom_styles: str | None, variant: str) -> str:
+    """Render the HTML markup of a single iconic card."""
+    # Apply custom styles if provided
+    styles = f"style='{custom_styles}'" if custom_styles else ""
+
+    # Add animation class if enabled
+    animation_class = "fadeIn" if animate else ""
+
+    return _CARD_TEMPLATE.format(
+        variant=variant, animation_class=animation_class, styles=styles, icon=icon, title=title, description=description
+    ).strip()
+
 
 def create_iconic_card(
     icon: str, title: str, description: str, animate: bool = True, custom_styles: str | None = None, variant: str = "feature"
@@ -21,22 +46,8 @@ def create_iconic_card(
         custom_styles: Optional additional CSS styles
         variant: Card variant (default: "feature")
     """
-    # Apply custom styles if provided
-    styles = f"style='{custom_styles}'" if custom_styles else ""
-
-    # Add animation class if enabled
-    animation_class = "fadeIn" if animate else ""
-
     st.markdown(
-        f"""
-        <div class="card card--{variant} {animation_class}" {styles}>
-            <div class="icon">{icon}</div>
-            <div class="content">
-                <h3>{title}</h3>
-                <p>{description}</p>
-            </div>
-        </div>
-        """,
+        _render_card(icon, title, description, animate=animate, custom_styles=custom_styles, variant=variant),
         unsafe_allow_html=True,
     )
 
@@ -50,22 +61,15 @@ def create_iconic_card_grid(cards: list[dict], columns: int = 2, animate: bool =
         animate: Whether to add fade-in animation (default: True)
         custom_styles: Optional additional CSS styles
     """
-    # Calculate number of rows needed
-    n_cards = len(cards)
-    n_rows = (n_cards + columns - 1) // columns
-
-    # Create the grid layout
-    for row in range(n_rows):
-        cols = st.columns(columns)
-        for col in range(columns):
-            idx = row * columns + col
-            if idx < n_cards:
-                card = cards[idx]
-                with cols[col]:
-                    create_iconic_card(
-                        icon=card["icon"],
-                        title=card["title"],
-                        description=card["description"],
-                        animate=animate and idx < 6,  # Limit animations to first 6 cards
-                        custom_styles=custom_styles,
-                    )
+    items = "".join(
+        _render_card(
+            card["icon"],
+            card["title"],
+            card["description"],
+            animate=animate and idx < 6,  # Limit animations to first 6 cards
+            custom_styles=custom_styles,
+            variant="feature",
+        )
+        for idx, card in enumerate(cards)
+    )
+    create_html_grid(items, columns)
@@ -5,8 +5,31 @@
 
 from __future__ import annotations
 
+from alforqan.frontend.custom_component.grid import create_html_grid
+
 import streamlit as st
 
+_METRIC_CARD_TEMPLATE = """
+<div class="metric-card">
+    <div class="metric-value">{value}</div>
+    <div class="metric-label">{label}</div>
+</div>
+"""
+
+_DATA_CONTAINER_TEMPLATE = """
+<div class="data-container" {styles}>
+    <div class="container-title">{title}</div>
+    {content}
+</div>
+"""
+
+_EMPTY_STATE_TEMPLATE = """
+<div class="empty-state" {styles}>
+    <div style="font-size: 2rem; margin-bottom: 1rem;">{emoji}</div>
+    <div>{message}</div>
+</div>
+"""
+
 
 def create_metrics_grid(metrics: list[dict[str, str | int | float]], columns: int = 3) -> None:
     """Create a grid of metric cards.
@@ -15,26 +38,8 @@ def create_metrics_grid(metrics: list[dict[str, str | int | float]], columns: in
         metrics: List of dictionaries containing 'label' and 'value' keys
         columns: Number of columns in the grid (default: 3)
     """
-    # Calculate the number of rows needed
-    n_metrics = len(metrics)
-    n_rows = (n_metrics + columns - 1) // columns
-
-    # Create the grid layout
-    for row in range(n_rows):
-        cols = st.columns(columns)
-        for col in range(columns):
-            idx = row * columns + col
-            if idx < n_metrics:
-                metric = metrics[idx]
-                cols[col].markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value">{metric['value']}</div>
-                        <div class="metric-label">{metric['label']}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+    items = "".join(_METRIC_CARD_TEMPLATE.format_map(metric).strip() for metric in metrics)
+    create_html_grid(items, columns)
 
 
 def create_data_container(title: str, content: str, custom_styles: str | None = None) -> None:
@@ -46,15 +51,7 @@ def create_data_container(title: str, content: str, custom_styles: str | None =
         custom_styles: Optional additional CSS styles
     """
     styles = f"style='{custom_styles}'" if custom_styles else ""
-    st.markdown(
-        f"""
-        <div class="data-container" {styles}>
-            <div class="container-title">{title}</div>
-            {content}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_DATA_CONTAINER_TEMPLATE.format(styles=styles, title=title, content=content), unsafe_allow_html=True)
 
 
 def create_empty_state(message: str, emoji: str = "📝", custom_styles: str | None = None) -> None:
@@ -66,12 +63,4 @@ def create_empty_state(message: str, emoji: str = "📝", custom_styles: str | N
         custom_styles: Optional additional CSS styles
     """
     styles = f"style='{custom_styles}'" if custom_styles else ""
-    st.markdown(
-        f"""
-        <div class="empty-state" {styles}>
-            <div style="font-size: 2rem; margin-bottom: 1rem;">{emoji}</div>
-            <div>{message}</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_EMPTY_STATE_TEMPLATE.format(styles=styles, emoji=emoji, message=message), unsafe_allow_html=True)
@@ -0,0 +1,21 @@
+"""
+@author: M.Abdulrahman Alnaseer (GitHub: https://github.com/abdalrohman)
+@license: MIT
+"""
+
+from __future__ import annotations
+
+import streamlit as st
+
+# The column count is passed as a CSS variable so grid.css can still collapse the grid on narrow screens
+_GRID_TEMPLATE = '<div class="grid grid--columns" style="--grid-columns: {columns};">{items}</div>'
+
+
+def create_html_grid(items: str, columns: int) -> None:
+    """Render pre-built HTML items into a single CSS grid, so the whole grid is one markdown element.
+
+    Args:
+        items: Concatenated HTML markup of the grid items
+        columns: Number of columns on wide screens; narrow screens stack the items in one column
+    """
+    st.markdown(_GRID_TEMPLATE.format(columns=columns, items=items), unsafe_allow_html=True)
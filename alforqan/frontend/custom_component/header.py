@@ -7,6 +7,13 @@ from __future__ import annotations
 
 import streamlit as st
 
+_HEADER_TEMPLATE = """
+<div class="header-section header-section--{variant}" {styles}>
+    <h1 class="header-title">{title}</h1>
+    <p class="header-description">{description}</p>
+</div>
+"""
+
 
 def create_header_section(
     title: str,
@@ -25,11 +32,6 @@ def create_header_section(
     styles = f"style='{custom_styles}'" if custom_styles else ""
 
     st.markdown(
-        f"""
-        <div class="header-section header-section--{variant}" {styles}>
-            <h1 class="header-title">{title}</h1>
-            <p class="header-description">{description}</p>
-        </div>
-        """,
+        _HEADER_TEMPLATE.format(variant=variant, styles=styles, title=title, description=description),
         unsafe_allow_html=True,
     )
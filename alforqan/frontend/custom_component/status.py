@@ -7,6 +7,17 @@ from __future__ import annotations
 
 import streamlit as st
 
+_STATUS_TEMPLATE = """
+<div class="status status--{kind} fadeIn" style="{styles}">
+    {emoji} {message}
+</div>
+"""
+
+
+def _show_status(kind: str, emoji: str, message: str, custom_styles: str | None) -> None:
+    """Render a status notification of the given kind."""
+    st.markdown(_STATUS_TEMPLATE.format(kind=kind, emoji=emoji, message=message, styles=custom_styles or ""), unsafe_allow_html=True)
+
 
 def show_success(message: str, custom_styles: str | None = None) -> None:
     """Display a success status notification.
@@ -15,15 +26,7 @@ def show_success(message: str, custom_styles: str | None = None) -> None:
         message: The success message to display
         custom_styles: Optional additional CSS styles
     """
-    styles = custom_styles or ""
-    st.markdown(
-        f"""
-        <div class="status status--success fadeIn" style="{styles}">
-            ✅ {message}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _show_status("success", "✅", message, custom_styles)
 
 
 def show_error(message: str, custom_styles: str | None = None) -> None:
@@ -33,15 +36,7 @@ def show_error(message: str, custom_styles: str | None = None) -> None:
         message: The error message to display
         custom_styles: Optional additional CSS styles
     """
-    styles = custom_styles or ""
-    st.markdown(
-        f"""
-        <div class="status status--error fadeIn" style="{styles}">
-            ❌ {message}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _show_status("error", "❌", message, custom_styles)
 
 
 def show_info(message: str, custom_styles: str | None = None) -> None:
@@ -51,15 +46,7 @@ def show_info(message: str, custom_styles: str | None = None) -> None:
         message: The information message to display
         custom_styles: Optional additional CSS styles
     """
-    styles = custom_styles or ""
-    st.markdown(
-        f"""
-        <div class="status status--info fadeIn" style="{styles}">
-            ℹ️ {message}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _show_status("info", "ℹ️", message, custom_styles)
 
 
 def show_warning(message: str, custom_styles: str | None = None) -> None:
@@ -69,12 +56,4 @@ def show_warning(message: str, custom_styles: str | None = None) -> None:
         message: The warning message to display
         custom_styles: Optional additional CSS styles
     """
-    styles = custom_styles or ""
-    st.markdown(
-        f"""
-        <div class="status status--warning fadeIn" style="{styles}">
-            ⚠️ {message}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _show_status("warning", "⚠️", message, custom_styles)
@@ -7,6 +7,13 @@ from __future__ import annotations
 
 import streamlit as st
 
+_STEP_HEADER_TEMPLATE = """
+<div class="section-header" {styles}>
+    <div class="number-badge">{number}</div>
+    <h2>{title}</h2>
+</div>
+"""
+
 
 def create_stp_header(number: int, title: str, custom_styles: str | None = None) -> None:
     """Create a numbered section header with hover effects.
@@ -17,12 +24,4 @@ def create_stp_header(number: int, title: str, custom_styles: str | None = None)
         custom_styles: Optional additional CSS styles
     """
     styles = f"style='{custom_styles}'" if custom_styles else ""
-    st.markdown(
-        f"""
-        <div class="section-header" {styles}>
-            <div class="number-badge">{number}</div>
-            <h2>{title}</h2>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_STEP_HEADER_TEMPLATE.format(styles=styles, number=number, title=title), unsafe_allow_html=True)
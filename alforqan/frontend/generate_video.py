@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import shutil
 
@@ -16,6 +17,17 @@ from alforqan.frontend.custom_component.status import *
 
 import streamlit as st
 
+# Font paths already installed in this process; re-running FontHelper.install() costs a filesystem scan per render
+_installed_fonts: set[str] = set()
+
+
+def _ensure_font_installed(path: str) -> None:
+    """Install the font at ``path`` once per process, retrying on later renders if installation failed"""
+    if path in _installed_fonts:
+        return
+    if FontHelper(path).install():
+        _installed_fonts.add(path)
+
 
 def generate_video(
     verse_info,
@@ -47,8 +59,8 @@ def generate_video(
 
             # Ensure the font installed on the system before enter the scene
             # Important step before generate the video
-            FontHelper(app_config.get("fonts.font_path")).install()
-            FontHelper(app_config.get("fonts.font_info_path")).install()
+            _ensure_font_installed(app_config.get("fonts.font_path"))
+            _ensure_font_installed(app_config.get("fonts.font_info_path"))
 
             # Create and render scene
             scene = QuranVerseScene(
@@ -86,7 +98,14 @@ def generate_video(
             else:
                 output_file = temp_directory / Path("images_dir") / f"{verse_range.output_filename}.png"
             if output_file.exists():
-                shutil.move(str(output_file), str(output_directory / output_file.name))
+                # The output directory may have been removed during a long render
+                output_directory.mkdir(parents=True, exist_ok=True)
+                destination = output_directory / output_file.name
+                try:
+                    # Same filesystem in practice, so this is a single atomic rename
+                    os.replace(output_file, destination)
+                except OSError:
+                    shutil.move(output_file, destination)
                 return True
         except Exception as e:
             show_error(f"Error generating video: {str(e)}")
@@ -10,16 +10,19 @@ from alforqan.backend.quran_data.quran_data_manager import QuranDataManager
 import streamlit as st
 
 
+@st.cache_resource(show_spinner=False)
+def _get_quran_manager(quran_data_filepath: str, audio_directory: str) -> QuranDataManager:
+    """Parse the Quran data file once and share the manager, and its download session, across verse ranges"""
+    return QuranDataManager(quran_data_filepath=quran_data_filepath, audio_directory=audio_directory)
+
+
 def get_verse_info(verse_range, app_config, audio_directory, status):
     """Fetch verse information from QuranDataManager"""
     status.update(
         label=f"Processing verses: Surah {verse_range.surah_number}: Verses {verse_range.start_verse} - {verse_range.end_verse}",
     )
 
-    quran_manager = QuranDataManager(
-        quran_data_filepath=app_config.get("quran_data.json_data_file"),
-        audio_directory=str(audio_directory),
-    )
+    quran_manager = _get_quran_manager(app_config.get("quran_data.json_data_file"), str(audio_directory))
 
     verse_info = quran_manager.get_verses_info(
         reciter_id=int(verse_range.reciter_id),
@@ -5,52 +5,63 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+
 from alforqan.backend.quran_data.audio_processor import AudioProcessor
 from alforqan.frontend.custom_component.status import show_error, show_success
 
 import streamlit as st
 
+# Each verse is decoded and re-encoded by its own ffmpeg subprocess, so threads overlap well
+MAX_AUDIO_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _process_verse_audio(audio_processor: AudioProcessor, preprocessor: AudioProcessor, index: int, path: str | Path) -> dict[str, float]:
+    """Normalize and preprocess a single verse, writing to paths unique to ``index``"""
+    normalized_audio = audio_processor.normalize_audio(path, Path(audio_processor.temp_dir) / f"normalized_{index}.mp3")
+    return preprocessor.preprocess_audio(normalized_audio, Path(preprocessor.temp_dir) / f"preprocessed_{index}.mp3")
+
 
 def process_audio_files(verse_info, audio_directory, status):
     """Process audio files for the verses"""
     verse_data = verse_info["verse_info"][0]
     full_surah_output = audio_directory / f"{verse_data['sura_name_en']}.mp3"
+    audio_paths = verse_info["verses_audio_paths"]
+    total = len(audio_paths)
+
+    # The preset processor is built once and shared; it is stateless apart from its settings and temp directory
+    with (
+        AudioProcessor() as audio_processor,
+        AudioProcessor.create_with_preset("conservative") as preprocessor,
+        ThreadPoolExecutor(max_workers=MAX_AUDIO_WORKERS) as executor,
+    ):
+        futures = [executor.submit(_process_verse_audio, audio_processor, preprocessor, i, path) for i, path in enumerate(audio_paths)]
+        progress_bar = st.progress(0.0, text="Processing verses...")
+        # The progress bar already moves per verse, so the status label only needs about 20 updates per run
+        status_every = max(1, total // 20)
+
+        def processed_files_in_order():
+            """Yield each processed file as soon as it and every earlier verse are ready, preserving merge order"""
+            for completed, future in enumerate(futures, start=1):
+                processed_path = future.result()["path"]
+                if completed % status_every == 0 or completed == total:
+                    status.update(label=f"Processing Audio: File {completed} of {total}")
+                progress_bar.progress(completed / total, text=f"Processed verse {completed} of {total}")
+                yield processed_path
+
+            status.update(label="Combining processed audio files...")
+
+        # The merge consumes files while later verses are still being processed
+        try:
+            merge_info = audio_processor.merge_audio_files(processed_files_in_order(), full_surah_output)
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            show_error(f"Error processing audio: {str(e)}")
+            return None
 
-    with AudioProcessor() as audio_processor:
-        durations = []
-        processed_files = []
-
-        # Create a progress container
-        progress_container = st.container()
-
-        # Process individual audio files
-        for i, path in enumerate(verse_info["verses_audio_paths"]):
-            status.update(label=f"Processing Audio: File {i + 1} of {len(verse_info['verses_audio_paths'])}")
-
-            with progress_container:
-                progress_text = f"Processing verse {i + 1}"
-                progress_bar = st.progress(0, text=progress_text)
-
-            try:
-                # Audio processing steps
-                normalized_audio = audio_processor.normalize_audio(path)
-                progress_bar.progress(0.33, text=f"{progress_text} - Normalized")
-
-                processed_file_info = audio_processor.create_with_preset("conservative").preprocess_audio(normalized_audio)
-                progress_bar.progress(0.66, text=f"{progress_text} - Processed")
-
-                durations.append(processed_file_info["duration"])
-                processed_files.append(processed_file_info["path"])
-
-                progress_bar.progress(1.0, text=f"{progress_text} - Complete")
-            except Exception as e:
-                show_error(f"Error processing audio: {str(e)}")
-                return None
-
-        # Merge processed files
-        status.update(label="Combining processed audio files...")
-
-        merge_info = audio_processor.merge_audio_files(processed_files, full_surah_output)
         final_durations = [change["effective_duration_ms"] / 1000 for change in merge_info["duration_changes"]]
 
         show_success("Audio processing completed successfully!")
@@ -5,9 +5,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-import hashlib
 
 from alforqan.backend.utils.every_ayah_downloader import QuranAudioDownloader
 from alforqan.frontend.custom_component.data_display import create_empty_state, create_metrics_grid
@@ -22,8 +21,14 @@ import streamlit as st
 MAX_TABLE_HEIGHT = 500
 TABLE_HEIGHT_THRESHOLD = 10
 
+# Background colours for the queue table's Status cells
+STATUS_STYLES = {
+    "🔄 Pending": "background-color: #084298;",  # Blue background for pending
+    "✅ Completed": "background-color: #0a3622;",  # Green background for completed
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class QuranicVerseRange:
     """Data class to store Quranic verse range information for audio processing"""
 
@@ -34,15 +39,18 @@ class QuranicVerseRange:
     end_verse: int
     output_filename: str
     created_at: str = None
+    _display_created_at: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()  # noqa: DTZ005
+        # Formatted once for the queue table: "YYYY-MM-DDTHH:MM:SS[.ffffff]" -> "YYYY-MM-DD HH:MM:SS"
+        self._display_created_at = self.created_at[:19].replace("T", " ")
 
     def generate_unique_id(self) -> str:
         """Generate a unique identifier for the verse range"""
-        key_string = f"{self.reciter_id}_{self.surah_number}_{self.start_verse}_{self.end_verse}"
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        # The key is only used for in-memory deduplication, so the composite string is unique enough without hashing
+        return f"{self.reciter_id}_{self.surah_number}_{self.start_verse}_{self.end_verse}"
 
 
 class QuranicVerseProcessor:
@@ -74,8 +82,8 @@ class QuranicVerseProcessor:
     def add_verse_range(verse_range: QuranicVerseRange) -> bool:
         """Add a new verse range to the queue if not duplicate"""
         unique_id = verse_range.generate_unique_id()
-        if unique_id not in st.session_state.verse_queue:
-            st.session_state.verse_queue[unique_id] = verse_range
+        # setdefault inserts and checks for a duplicate with a single lookup
+        if st.session_state.verse_queue.setdefault(unique_id, verse_range) is verse_range:
             st.session_state.processing_queue.add(unique_id)
             return True
         return False
@@ -83,7 +91,12 @@ class QuranicVerseProcessor:
     @staticmethod
     def get_pending_verses() -> dict[str, QuranicVerseRange]:
         """Retrieve all pending verse ranges"""
-        return {key: verse_range for key, verse_range in st.session_state.verse_queue.items() if key in st.session_state.processing_queue}
+        # The processing queue holds exactly the pending IDs, so iterate it rather than scanning the whole queue
+        verse_queue = st.session_state.verse_queue
+        pending_ids = [key for key in st.session_state.processing_queue if key in verse_queue]
+        # Sets are unordered; keep processing in the order the ranges were queued
+        pending_ids.sort(key=lambda key: verse_queue[key].created_at)
+        return {key: verse_queue[key] for key in pending_ids}
 
     @staticmethod
     def mark_completed(unique_id: str):
@@ -106,28 +119,34 @@ class QuranicVerseProcessor:
         if not st.session_state.verse_queue:
             return pd.DataFrame()
 
-        queue_data = []
-        for unique_id, verse_range in st.session_state.verse_queue.items():
-            processing_status = "🔄 Pending" if unique_id in st.session_state.processing_queue else "✅ Completed"
-            queue_data.append(
-                {
-                    "Surah": verse_range.surah_number,
-                    "Starting Verse": verse_range.start_verse,
-                    "Ending Verse": verse_range.end_verse,
-                    "Reciter": verse_range.reciter_name,
-                    "Status": processing_status,
-                    "Added On": datetime.fromisoformat(verse_range.created_at).strftime("%Y-%m-%d %H:%M:%S"),
-                    "ID": unique_id,
-                }
-            )
-
-        df = pd.DataFrame(queue_data)
-        if not df.empty:
-            df["sort_priority"] = df["Status"].map({"🔄 Pending": 0, "✅ Completed": 1})
-            df = df.sort_values(["sort_priority", "Added On"], ascending=[True, False])
-            df = df.drop("sort_priority", axis=1)
-
-        return df
+        # Pending rows come first and each group is newest first; partitioning by queue membership
+        # gives that order directly, without a helper sort column
+        pending = st.session_state.processing_queue
+        pending_items = []
+        completed_items = []
+        for item in st.session_state.verse_queue.items():
+            (pending_items if item[0] in pending else completed_items).append(item)
+        pending_items.sort(key=lambda item: item[1].created_at, reverse=True)
+        completed_items.sort(key=lambda item: item[1].created_at, reverse=True)
+
+        # Build the table column by column so pandas does not have to transpose per-row dicts
+        columns: dict[str, list] = {
+            "Surah": [],
+            "Starting Verse": [],
+            "Ending Verse": [],
+            "Reciter": [],
+            "Status": ["🔄 Pending"] * len(pending_items) + ["✅ Completed"] * len(completed_items),
+            "Added On": [],
+            "ID": [],
+        }
+        for unique_id, verse_range in pending_items + completed_items:
+            columns["Surah"].append(verse_range.surah_number)
+            columns["Starting Verse"].append(verse_range.start_verse)
+            columns["Ending Verse"].append(verse_range.end_verse)
+            columns["Reciter"].append(verse_range.reciter_name)
+            columns["Added On"].append(verse_range._display_created_at)
+            columns["ID"].append(unique_id)
+        return pd.DataFrame(columns)
 
 
 # Initialize processors
@@ -135,15 +154,20 @@ audio_processor = QuranAudioDownloader()
 verse_processor = QuranicVerseProcessor()
 
 
-@st.cache_data(show_spinner=False)
-def fetch_available_reciters() -> list[dict]:
+@st.cache_data(persist="disk", show_spinner=False)
+def _load_sorted_reciters() -> tuple[dict, ...]:
+    """Fetch the reciter list once and keep it sorted by name, persisted across app restarts"""
+    return tuple(sorted(audio_processor.list_available_reciters(), key=lambda x: x["name"]))
+
+
+def fetch_available_reciters() -> tuple[dict, ...]:
     """Fetch and cache available Quran reciters"""
+    # Errors are handled outside the cached function so a failed fetch is retried rather than persisted
     try:
-        reciters = audio_processor.list_available_reciters()
-        return sorted(reciters, key=lambda x: x["name"])
+        return _load_sorted_reciters()
     except Exception as e:
         show_error(f"Failed to retrieve reciters: {str(e)}")
-        return []
+        return ()
 
 
 def display_processing_queue():
@@ -175,19 +199,9 @@ def display_processing_queue():
     if not queue_df.empty:
         create_stp_header(2, "Processing Queue")
 
-        # Style the status column
-        def style_status_column(row):
-            styles = []
-            for val in row:
-                if val == "🔄 Pending":
-                    styles.append("background-color: #084298;")  # Blue background for pending
-                else:
-                    styles.append("background-color: #0a3622;")  # Green background for completed
-            return styles
-
         # Prepare and style the dataframe
         display_df = queue_df.drop(columns=["ID"])
-        styled_df = display_df.style.apply(style_status_column, subset=["Status"])
+        styled_df = display_df.style.map(STATUS_STYLES.get, subset=["Status"])
 
         # Additional styling for the entire dataframe
         styled_df = styled_df.set_properties(
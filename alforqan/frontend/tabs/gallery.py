@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-import io
+import functools
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -20,11 +21,12 @@ MediaType = Literal["video", "image"]
 
 SUPPORTED_VIDEO_FORMATS = {".mp4", ".mov", ".webm"}
 SUPPORTED_IMAGE_FORMATS = {".png"}
+SUPPORTED_MEDIA_FORMATS = SUPPORTED_VIDEO_FORMATS | SUPPORTED_IMAGE_FORMATS
 
 
-def get_media_type(file_path: Path) -> MediaType:
-    """Determine if the file is a video or image based on extension"""
-    suffix = file_path.suffix.lower()
+@functools.cache
+def _media_type_for_suffix(suffix: str) -> MediaType:
+    """Classify a lowercase file suffix, computed once per distinct extension"""
     if suffix in SUPPORTED_VIDEO_FORMATS:
         return "video"
     elif suffix in SUPPORTED_IMAGE_FORMATS:
@@ -32,61 +34,87 @@ def get_media_type(file_path: Path) -> MediaType:
     raise ValueError(f"Unsupported file format: {suffix}")
 
 
-def get_media_data(media_path: Path) -> tuple:
+def get_media_type(file_path: Path) -> MediaType:
+    """Determine if the file is a video or image based on extension"""
+    return _media_type_for_suffix(file_path.suffix.lower())
+
+
+def get_media_data(media_path: Path, stats: os.stat_result | None = None) -> tuple:
     """Helper function to get media file data efficiently"""
-    stats = media_path.stat()
+    stats = stats or media_path.stat()
     file_size = stats.st_size / (1024 * 1024)  # Convert to MB
     modified_time = datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M")
     media_type = get_media_type(media_path)
     return file_size, modified_time, media_type
 
 
-def read_media_bytes(media_path: Path) -> io.BytesIO:
-    """Efficiently read media file into memory"""
-    buffer = io.BytesIO()
-    chunk_size = 8192  # 8KB chunks for efficient memory usage
-
-    with open(media_path, "rb") as file:
-        while True:
-            chunk = file.read(chunk_size)
-            if not chunk:
-                break
-            buffer.write(chunk)
-
-    buffer.seek(0)
-    return buffer
+def _prefetch_media(media_files: list[Path]) -> None:
+    """Ask the kernel to start reading media files in the background before the cards render them"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for media_path in media_files:
+        try:
+            fd = os.open(media_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+def read_media_bytes(media_path: Path) -> bytes:
+    """Read a media file into memory with a single read call"""
+    return media_path.read_bytes()
+
+
+def _set_download_prepared(prepared_key: str, prepared: bool) -> None:
+    """Button callback that toggles whether a card's file is read for its download button"""
+    st.session_state[prepared_key] = prepared
+
+
+def _scan_media_entries(output_directory: Path) -> list[tuple[Path, os.stat_result, MediaType]]:
+    """Find all supported media files and stat them in a single directory pass"""
+    entries = []
+    try:
+        with os.scandir(output_directory) as directory:
+            for entry in directory:
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in SUPPORTED_MEDIA_FORMATS and entry.is_file():
+                    entries.append((Path(entry.path), entry.stat(), _media_type_for_suffix(suffix)))
+    except FileNotFoundError:
+        # A missing output directory simply means nothing has been generated yet
+        return []
+    return entries
 
 
 def display_media_gallery(output_directory: Path):
     """Display generated videos and images in an enhanced grid layout with metadata and actions"""
-    # Find all supported media files
-    media_files = []
-    for format_group in [SUPPORTED_VIDEO_FORMATS, SUPPORTED_IMAGE_FORMATS]:
-        for ext in format_group:
-            media_files.extend(output_directory.glob(f"*{ext}"))
+    entries = _scan_media_entries(output_directory)
 
     # Header section with stats
     create_header_section("Media Gallery", "Browse and manage your generated visualizations")
 
-    if not media_files:
+    if not entries:
         create_iconic_card(
             "🎬", "No Media Files Yet", "Generated videos and images will appear here. Start by creating your first visualization!"
         )
         return
 
-    # Calculate statistics
-    total_files = len(media_files)
-    total_size = sum(file.stat().st_size for file in media_files) / (1024 * 1024)
-    video_count = sum(1 for f in media_files if get_media_type(f) == "video")
-    image_count = sum(1 for f in media_files if get_media_type(f) == "image")
-
-    if media_files:
-        modification_times = [file.stat().st_mtime for file in media_files]
-        newest = max(modification_times)
-        oldest = min(modification_times)
-        days_active = (newest - oldest) / 86400
-    else:
-        days_active = 0
+    # Calculate statistics in a single pass, tracking the modification time range inline
+    total_files = len(entries)
+    total_size = 0
+    video_count = 0
+    newest = oldest = entries[0][1].st_mtime
+    for _, stats, media_type in entries:
+        total_size += stats.st_size
+        if media_type == "video":
+            video_count += 1
+        newest = max(newest, stats.st_mtime)
+        oldest = min(oldest, stats.st_mtime)
+    total_size /= 1024 * 1024
+    image_count = total_files - video_count
+    days_active = (newest - oldest) / 86400
 
     gallery_stats = [
         {"label": "Total Files", "value": total_files},
@@ -98,12 +126,14 @@ def display_media_gallery(output_directory: Path):
     create_metrics_grid(gallery_stats)
 
     # Sort files by creation time (newest first)
-    media_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
+    media_files = [path for path, _, _ in entries]
+
+    # Card metadata comes straight from the stat results of the directory scan
+    card_data = [get_media_data(media_path, stats) for media_path, stats, _ in entries]
 
-    # Grid layout with caching for performance
-    @st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
-    def get_cached_media_data(media_path: Path):
-        return get_media_data(media_path)
+    # st.video/st.image read each file in turn; overlap that disk I/O with rendering of earlier cards
+    _prefetch_media(media_files)
 
     # Display media files in grid
     num_files = len(media_files)
@@ -115,7 +145,7 @@ def display_media_gallery(output_directory: Path):
             if i + j < num_files:
                 with col:
                     media_path = media_files[i + j]
-                    file_size, modified_time, media_type = get_cached_media_data(media_path)
+                    file_size, modified_time, media_type = card_data[i + j]
 
                     # Display media based on type
                     if media_type == "video":
@@ -147,13 +177,24 @@ def display_media_gallery(output_directory: Path):
                         """,
                         unsafe_allow_html=True,
                     )
-                    # Download button
-                    media_bytes = read_media_bytes(media_path)
-                    st.download_button(
-                        "Download",
-                        media_bytes,
-                        file_name=f"{media_path.name}",
-                        key=f"download_{media_path.stem}",
-                        use_container_width=True,
-                        icon="⬇️",
-                    )
+                    # Download button; the file is only read after the user asks for it and until they download it
+                    prepared_key = f"download_prepared_{media_path.stem}"
+                    if st.session_state.get(prepared_key):
+                        st.download_button(
+                            "Download",
+                            read_media_bytes(media_path),
+                            file_name=f"{media_path.name}",
+                            key=f"download_{media_path.stem}",
+                            on_click=_set_download_prepared,
+                            args=(prepared_key, False),
+                            use_container_width=True,
+                            icon="⬇️",
+                        )
+                    else:
+                        st.button(
+                            "Prepare download",
+                            key=f"prepare_{media_path.stem}",
+                            on_click=_set_download_prepared,
+                            args=(prepared_key, True),
+                            use_container_width=True,
+                        )
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
-from alforqan.backend.core.backgrounds import BackgroundStyle
+from operator import itemgetter
+
+from alforqan.backend.core.backgrounds import BACKGROUND_STYLE_VALUES
 from alforqan.backend.core.backgrounds.gradient_direction import ManimDirections
-from alforqan.backend.core.color_scheme import ColorScheme
+from alforqan.backend.core.color_scheme import COLOR_SCHEME_VALUES
 from alforqan.backend.utils.utils import sanitize_name
 from alforqan.frontend.custom_component.step_header import create_stp_header
 from alforqan.frontend.process_verses import QuranicVerseRange, fetch_available_reciters, verse_processor
@@ -18,170 +20,211 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Selectbox options and their positions, fixed for the life of the process
+_BACKGROUND_INDEX = {value: i for i, value in enumerate(BACKGROUND_STYLE_VALUES)}
+_COLOR_SCHEME_INDEX = {value: i for i, value in enumerate(COLOR_SCHEME_VALUES)}
+_QUALITY_VALUES = tuple(constants.QUALITIES)
+_DEFAULT_QUALITY_INDEX = _QUALITY_VALUES.index("production_quality")
+_OUTPUT_MODES = ("video", "image")
+_OUTPUT_MODE_INDEX = {mode: i for i, mode in enumerate(_OUTPUT_MODES)}
+_ASPECT_RATIOS = ("16:9", "9:16", "4:3", "1:1", "12:12")
+_ASPECT_RATIO_INDEX = {ratio: i for i, ratio in enumerate(_ASPECT_RATIOS)}
+_DIRECTIONS = tuple(ManimDirections().get_streamlit_options())
+_format_direction = itemgetter(1)  # Show the description part of each (name, description) option
+
+# Upper bound on reciter options sent to the browser; the search box narrows the rest
+MAX_RECITER_OPTIONS = 50
+
+
+# The single in-memory layer over the disk-cached reciter list, so it is unpickled once per process, not per rerun
+@st.cache_resource(show_spinner=False)
+def _reciter_index() -> tuple[tuple[str, ...], tuple[str, ...], dict[str, int]]:
+    """Build the reciter selectbox labels, their lowercase search keys and a label -> reciter id lookup once"""
+    reciters = fetch_available_reciters()
+    display_options = tuple(f"{r['name']} ({r['quality']})" for r in reciters)
+    search_keys = tuple(display.lower() for display in display_options)
+    return display_options, search_keys, {display: r["id"] for display, r in zip(display_options, reciters, strict=True)}
+
+
+def _search_reciter_options(query: str, display_options: tuple[str, ...], search_keys: tuple[str, ...]) -> list[str]:
+    """Return the reciter labels matching the search, capped at MAX_RECITER_OPTIONS, and tell the user what was left out"""
+    matches = [display for display, search_key in zip(display_options, search_keys, strict=True) if query in search_key]
+    if display_options and not matches:
+        st.warning("No reciters match your search")
+    elif len(matches) > MAX_RECITER_OPTIONS:
+        st.caption(f"Showing {MAX_RECITER_OPTIONS} of {len(matches)} reciters, search to find the others")
+    return matches[:MAX_RECITER_OPTIONS]
+
 
 def input_tab(app_config, visualization_config):
     create_stp_header(1, "Select Reciter")
-    available_reciters = fetch_available_reciters()
-    reciter_display_options = [f"{r['name']} ({r['quality']})" for r in available_reciters]
-    selected_reciter_option = st.selectbox(
-        "Available Reciters",
-        options=reciter_display_options,
-        index=0 if reciter_display_options else 0,
-        help="Choose a reciter for the verse audio",
-    )
-
-    selected_reciter_name = (
-        reciter_display_options[reciter_display_options.index(selected_reciter_option)] if reciter_display_options else None
-    )
-    reciter_id = available_reciters[reciter_display_options.index(selected_reciter_option)]["id"] if reciter_display_options else None
-
-    create_stp_header(2, "Select Verses")
-    verse_col1, verse_col2, verse_col3 = st.columns(3)
-
-    with verse_col1:
-        surah_number = st.number_input(
-            "Surah Number",
-            min_value=1,
-            max_value=114,
-            value=1,
-            help="Enter the Surah number (1-114)",
+    all_reciter_options, reciter_search_keys, reciter_id_by_display = _reciter_index()
+    if not all_reciter_options:
+        # Do not keep an empty index from a failed fetch; the next rerun tries again
+        _reciter_index.clear()
+
+    reciter_query = st.text_input("Search Reciters", help="Type part of a reciter name to narrow the list").strip().lower()
+    reciter_display_options = _search_reciter_options(reciter_query, all_reciter_options, reciter_search_keys)
+
+    # All settings live in one form so configuring a render reruns the script once, on submit, instead of per widget
+    with st.form("input_form", border=False):
+        selected_reciter_option = st.selectbox(
+            "Available Reciters",
+            options=reciter_display_options,
+            index=0,
+            help="Choose a reciter for the verse audio",
         )
 
-    with verse_col2:
-        verse_start = st.number_input(
-            "Starting Verse",
-            min_value=1,
-            value=1,
-            help="Select the first verse",
-        )
+        selected_reciter_name = selected_reciter_option
+        reciter_id = reciter_id_by_display.get(selected_reciter_option)
 
-    with verse_col3:
-        verse_end = st.number_input(
-            "Ending Verse",
-            min_value=verse_start,
-            value=verse_start,
-            help="Select the last verse",
-        )
+        create_stp_header(2, "Select Verses")
+        verse_col1, verse_col2, verse_col3 = st.columns(3)
 
-    # Step 3: Visualization Settings
-    create_stp_header(3, "Customize Visualization")
-    visual_col1, visual_col2, visual_col3 = st.columns(3)
+        with verse_col1:
+            surah_number = st.number_input(
+                "Surah Number",
+                min_value=1,
+                max_value=114,
+                value=1,
+                help="Enter the Surah number (1-114)",
+            )
 
-    with visual_col1:
-        background_style = st.selectbox(
-            "Background Theme",
-            options=[style.value for style in BackgroundStyle],
-            index=list(BackgroundStyle).index(BackgroundStyle(app_config.get("background.background"))),
-            help="Choose the background style for your video",
-        )
-        visualization_config["background"] = background_style
-
-    with visual_col2:
-        color_theme = st.selectbox(
-            "Color Theme",
-            options=[scheme.value for scheme in ColorScheme],
-            index=list(ColorScheme).index(ColorScheme(app_config.get("color_scheme.color_scheme"))),
-            help="Select the color scheme for text and elements",
-        )
-        visualization_config["color_scheme"] = color_theme
-
-    with visual_col3:
-        render_quality = st.selectbox(
-            "Output Quality",
-            options=constants.QUALITIES.keys(),
-            index=list(constants.QUALITIES.keys()).index("production_quality"),
-            help="Set the video rendering quality",
+        with verse_col2:
+            verse_start = st.number_input(
+                "Starting Verse",
+                min_value=1,
+                value=1,
+                help="Select the first verse",
+            )
+
+        with verse_col3:
+            # A fixed key and bounds keep the widget's identity stable when the starting verse changes in the same submit
+            verse_end = st.number_input(
+                "Ending Verse",
+                min_value=1,
+                value=None,
+                key="input_verse_end",
+                placeholder="Same as starting verse",
+                help="Select the last verse, or leave blank to queue only the starting verse",
+            )
+
+        # Step 3: Visualization Settings
+        create_stp_header(3, "Customize Visualization")
+        visual_col1, visual_col2, visual_col3 = st.columns(3)
+
+        with visual_col1:
+            background_style = st.selectbox(
+                "Background Theme",
+                options=BACKGROUND_STYLE_VALUES,
+                index=_BACKGROUND_INDEX[app_config.get("background.background")],
+                help="Choose the background style for your video",
+            )
+            visualization_config["background"] = background_style
+
+        with visual_col2:
+            color_theme = st.selectbox(
+                "Color Theme",
+                options=COLOR_SCHEME_VALUES,
+                index=_COLOR_SCHEME_INDEX[app_config.get("color_scheme.color_scheme")],
+                help="Select the color scheme for text and elements",
+            )
+            visualization_config["color_scheme"] = color_theme
+
+        with visual_col3:
+            render_quality = st.selectbox(
+                "Output Quality",
+                options=_QUALITY_VALUES,
+                index=_DEFAULT_QUALITY_INDEX,
+                help="Set the video rendering quality",
+            )
+            visualization_config["video_quality"] = render_quality
+
+        enable_gradient = st.checkbox(
+            "Enable Color Gradient",
+            value=True,
+            help="Apply a gradient effect to the text",
         )
-        visualization_config["video_quality"] = render_quality
-
-    enable_gradient = st.checkbox(
-        "Enable Color Gradient",
-        value=True,
-        help="Apply a gradient effect to the text",
-    )
-    visualization_config["gradient"] = enable_gradient
-    if enable_gradient:
+        visualization_config["gradient"] = enable_gradient
+        # Widgets inside a form do not rerun on change, so the gradient controls are always shown and only applied when enabled
         dir_col, inten_col = st.columns(2)
         with dir_col:
-            directions = ManimDirections().get_streamlit_options()
-
-            # Define a format function to display the second element of the tuple
-            def format_direction(x):
-                return x[1]  # Return the description part of the tuple
-
             gradient_direction = st.selectbox(
                 "Gradient Directions",
-                options=directions,
-                format_func=format_direction,
+                options=_DIRECTIONS,
+                format_func=_format_direction,
                 index=1,
             )
             gradient_direction = gradient_direction[0]  # Get just the direction name
         with inten_col:
             gradient_intensity = st.slider("Gradient intensity", min_value=0.0, max_value=1.0, value=0.3)
-        visualization_config.update(
-            {
-                "gradient_direction": gradient_direction,
-                "gradient_intensity": gradient_intensity,
-            }
-        )
+        if enable_gradient:
+            visualization_config.update(
+                {
+                    "gradient_direction": gradient_direction,
+                    "gradient_intensity": gradient_intensity,
+                }
+            )
 
-    # Advanced configuration options
-    aspect_ratios = ["16:9", "9:16", "4:3", "1:1", "12:12"]
-    output_modes = ["video", "image"]
-
-    with st.expander("Advanced Settings"):
-        mode_col, ratio_col = st.columns(2)
-        with mode_col:
-            output_mode = st.selectbox(
-                "Output Format",
-                output_modes,
-                index=output_modes.index(app_config.get("scene_settings.mode")),
-                help="Choose between video or image output",
+        # Advanced configuration options
+        with st.expander("Advanced Settings"):
+            mode_col, ratio_col = st.columns(2)
+            with mode_col:
+                output_mode = st.selectbox(
+                    "Output Format",
+                    _OUTPUT_MODES,
+                    index=_OUTPUT_MODE_INDEX[app_config.get("scene_settings.mode")],
+                    help="Choose between video or image output",
+                )
+            with ratio_col:
+                video_ratio = st.selectbox(
+                    "Aspect Ratio",
+                    _ASPECT_RATIOS,
+                    index=_ASPECT_RATIO_INDEX[app_config.get("scene_settings.aspect_ratio")],
+                    help="Select the video dimensions ratio",
+                )
+            renderer = st.selectbox(
+                "Choose the renderer",
+                ["cairo", "opengl"],
+                help=(
+                    "Select 'opengl' for better performance on compatible systems. Default 'cairo' works on all systems but may be slower."
+                ),
             )
-        with ratio_col:
-            video_ratio = st.selectbox(
-                "Aspect Ratio",
-                aspect_ratios,
-                index=aspect_ratios.index(app_config.get("scene_settings.aspect_ratio")),
-                help="Select the video dimensions ratio",
+            logger.info("Chosen renderer", renderer=renderer)
+
+            visualization_config.update(
+                {
+                    "mode": output_mode,
+                    "aspect_ratio": video_ratio,
+                    "renderer": renderer,
+                }
             )
-        renderer = st.selectbox(
-            "Choose the renderer",
-            ["cairo", "opengl"],
-            help="Select 'opengl' for better performance on compatible systems. Default 'cairo' works on all systems but may be slower.",
-        )
-        logger.info("Chosen renderer", renderer=renderer)
-
-        visualization_config.update(
-            {
-                "mode": output_mode,
-                "aspect_ratio": video_ratio,
-                "renderer": renderer,
-            }
-        )
 
-    # Action buttons with improved layout
-    create_stp_header(4, "Process")
-    action_col1, action_col2, action_col3 = st.columns(3)
+        # Action buttons with improved layout
+        create_stp_header(4, "Process")
+        submitted = st.form_submit_button("➕ Add to Queue", type="primary", use_container_width=True)
+
+    if submitted:
+        # A blank ending verse means a single verse range
+        verse_end = verse_end or verse_start
+        if selected_reciter_option is None:
+            st.error("⚠️ Select a reciter before adding verses to the queue")
+        elif verse_end < verse_start:
+            # The ending verse is not bounded by the starting verse while editing, so the order is checked on submit
+            st.error("⚠️ The ending verse cannot be before the starting verse")
+        else:
+            filename_parts = [sanitize_name(selected_reciter_name), f"surah_{surah_number:03d}", f"verse_{verse_start:03d}"]
+            if verse_end != verse_start:
+                filename_parts.append(f"to_{verse_end:03d}")
+            filename_parts += [background_style, color_theme, render_quality, video_ratio]
 
-    with action_col1:
-        if st.button("➕ Add to Queue", type="primary", use_container_width=True):
             verse_range = QuranicVerseRange(
                 reciter_id=reciter_id,
                 reciter_name=selected_reciter_name,
                 surah_number=surah_number,
                 start_verse=verse_start,
                 end_verse=verse_end,
-                output_filename=(
-                    f"{sanitize_name(selected_reciter_name)}_"
-                    f"surah_{surah_number:03d}_"
-                    f"verse_{verse_start:03d}"
-                    f"{f'_to_{verse_end:03d}' if verse_end != verse_start else ''}"
-                    f"_{background_style}"
-                    f"_{color_theme}"
-                    f"_{render_quality}"
-                    f"_{video_ratio}"
-                ),
+                output_filename="_".join(filename_parts),
             )
 
             if verse_processor.add_verse_range(verse_range):
@@ -191,13 +234,15 @@ def input_tab(app_config, visualization_config):
 
             # Switch the tab here
 
-    with action_col2:
+    action_col1, action_col2 = st.columns(2)
+
+    with action_col1:
         if st.button("🗑️ Clear Queue", use_container_width=True):
             verse_processor.clear_all_queues()
             st.success("🧹 Queue cleared successfully!")
             st.rerun()
 
-    with action_col3:
+    with action_col2:
         if st.button("🔄 Reset Pending", use_container_width=True):
             verse_processor.clear_processing_queue()
             st.success("🔄 Pending items reset!")
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from enum import Enum
 from pathlib import Path
+import re
 import shutil
 
 from alforqan.backend.utils.logging import LogConfig
@@ -22,15 +23,28 @@ from alforqan.frontend.tabs.input_tab import input_tab
 
 import streamlit as st
 
+
+@st.cache_resource(show_spinner=False)
+def load_app_config() -> Config:
+    """Parse the application config once per server process instead of on every rerun"""
+    return Config("config.toml")
+
+
+@st.cache_resource(show_spinner=False)
+def load_app_logger(log_path: str, log_level: str, environment: str, filters: list[str] | str | None):
+    """Configure logging once per server process and share the resulting logger"""
+    log_config = LogConfig(log_path, log_level=log_level, environment=environment, filters=filters)
+    return log_config.get_logger()
+
+
 # Initialize configuration
-app_config = Config("config.toml")
-log_config = LogConfig(
+app_config = load_app_config()
+app_logger = load_app_logger(
     app_config.get("settings.log_path"),
-    log_level=app_config.get("settings.log_level"),
-    environment=app_config.get("settings.environment"),
-    filters=app_config.get("settings.filters"),
+    app_config.get("settings.log_level"),
+    app_config.get("settings.environment"),
+    app_config.get("settings.filters"),
 )
-app_logger = log_config.get_logger()
 
 # Page configuration
 st.set_page_config(
@@ -46,29 +60,49 @@ if "processing_queue" not in st.session_state:
     st.session_state.processing_queue = set()
 
 
-def apply_global_styles(file_name: str) -> None:
-    if not Path(file_name).exists():
+# Style sheets injected on every page, in cascade order
+CSS_FILES = (
+    "alforqan/frontend/css/base.css",
+    "alforqan/frontend/css/components/header.css",
+    "alforqan/frontend/css/components/grid.css",
+    "alforqan/frontend/css/components/buttons.css",
+    "alforqan/frontend/css/components/checkbox.css",
+    "alforqan/frontend/css/components/disable.css",
+    "alforqan/frontend/css/components/input.css",
+    "alforqan/frontend/css/components/tabs.css",
+    "alforqan/frontend/css/components/progress.css",
+    "alforqan/frontend/css/components/step_header.css",
+    "alforqan/frontend/css/components/data_display.css",
+    "alforqan/frontend/css/components/cards.css",
+    "alforqan/frontend/css/components/section.css",
+    "alforqan/frontend/css/components/metadata.css",
+    "alforqan/frontend/css/components/video.css",
+)
+
+# Comments and whitespace runs dropped from the bundle, which is resent to the browser on every rerun
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@st.cache_data(show_spinner=False)
+def load_css_bundle(file_names: tuple[str, ...]) -> str:
+    """Read, concatenate and minify the style sheets once; later reruns reuse the cached bundle"""
+    css = "\n".join(Path(file_name).read_text() for file_name in file_names)
+    css = _CSS_COMMENT_PATTERN.sub("", css)
+    return _CSS_WHITESPACE_PATTERN.sub(" ", css).strip()
+
+
+def apply_global_styles(file_names: tuple[str, ...]) -> None:
+    try:
+        css = load_css_bundle(file_names)
+    except FileNotFoundError:
         st.error("Style sheet not found...")
         st.stop()
-    with open(file_name) as f:
-        st.html(f"<style>{f.read()}</style>")
+    st.html(f"<style>{css}</style>")
 
 
 # Apply css styles
-apply_global_styles("alforqan/frontend/css/base.css")
-apply_global_styles("alforqan/frontend/css/components/header.css")
-apply_global_styles("alforqan/frontend/css/components/buttons.css")
-apply_global_styles("alforqan/frontend/css/components/checkbox.css")
-apply_global_styles("alforqan/frontend/css/components/disable.css")
-apply_global_styles("alforqan/frontend/css/components/input.css")
-apply_global_styles("alforqan/frontend/css/components/tabs.css")
-apply_global_styles("alforqan/frontend/css/components/progress.css")
-apply_global_styles("alforqan/frontend/css/components/step_header.css")
-apply_global_styles("alforqan/frontend/css/components/data_display.css")
-apply_global_styles("alforqan/frontend/css/components/cards.css")
-apply_global_styles("alforqan/frontend/css/components/section.css")
-apply_global_styles("alforqan/frontend/css/components/metadata.css")
-apply_global_styles("alforqan/frontend/css/components/video.css")
+apply_global_styles(CSS_FILES)
 
 # Application Header
 st.markdown(
@@ -99,7 +133,8 @@ temp_directory = base_directory / OutputPaths.TEMPORARY.value
 output_directory = base_directory / OutputPaths.OUTPUT.value
 audio_directory = temp_directory / OutputPaths.AUDIO_FILES.value
 
-# Create required directories
+
+# Create required directories on every run, so one deleted while the server is up comes back on the next rerun
 for dir_path in [temp_directory, output_directory, audio_directory]:
     dir_path.mkdir(parents=True, exist_ok=True)
 
@@ -115,12 +150,12 @@ def cleanup_temporary_files():
         show_error(f"Error during cleanup: {str(e)}")
 
 
-visualization_config = {}
-
-
 # TODO generate the audio based on the media type
 def main():
     """Main application logic with enhanced UI organization"""
+    # Visual settings chosen in the input tab, kept per session for the processing step
+    visualization_config = st.session_state.setdefault("visualization_config", {})
+
     # Create main application sections
     tabs = st.tabs(
         ["📥 Create New", "⚙️ Processing Queue", "🎬 Gallery", "ℹ️ About"],
@@ -135,12 +170,18 @@ def main():
             pending_verses = verse_processor.get_pending_verses()
 
             if pending_verses:
+                total = len(pending_verses)
+                # Move the overall bar about 20 times per run rather than once per verse range
+                progress_step = max(1, total // 20)
                 progress_bar = st.progress(0)
-                st.write(f"📊 Processing {len(pending_verses)} verse ranges...")
+                st.write(f"📊 Processing {total} verse ranges...")
+                # One status widget reused for every range instead of a new one per iteration
+                status = st.status("Processing verses...", expanded=True)
 
-                for idx, (verse_id, verse_range) in enumerate(pending_verses.items()):
+                for idx, (verse_id, verse_range) in enumerate(pending_verses.items(), start=1):
                     try:
-                        with st.status("Processing verses...", expanded=True) as status:
+                        status.update(state="running")
+                        with status:
                             verse_info = get_verse_info(verse_range, app_config, audio_directory, status)
                             full_surah_output, final_durations = process_audio_files(verse_info, audio_directory, status)
 
@@ -157,10 +198,12 @@ def main():
                         if success:
                             verse_processor.mark_completed(verse_id)
                             cleanup_temporary_files()
-                        progress_bar.progress((idx + 1) / len(pending_verses))
                     except Exception as e:
                         st.error(f"Error processing verse range: {str(e)}")
 
+                    if idx % progress_step == 0 or idx == total:
+                        progress_bar.progress(idx / total)
+
                 show_success("Processing completed successfully!")
             else:
                 show_info("No pending verses to process")